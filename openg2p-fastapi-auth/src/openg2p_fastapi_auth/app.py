@@ -4,12 +4,16 @@
 
 import asyncio
 
+import httpx
+
 from .config import Settings
 
 _config = Settings.get_config(strict=False)
 
+from fastapi import FastAPI
 from openg2p_fastapi_common.app import Initializer
 
+from .context import http_client
 from .controllers.auth_controller import AuthController
 from .controllers.oauth_controller import OAuthController
 from .models.orm.login_provider import LoginProvider
@@ -18,9 +22,16 @@ from .models.orm.login_provider import LoginProvider
 class Initializer(Initializer):
     def initialize(self, **kwargs):
         # Initialize all Services, Controllers, any utils here.
+        http_client.set(httpx.AsyncClient(timeout=_config.http_client_timeout_secs))
         AuthController().post_init()
         OAuthController().post_init()
 
+    async def fastapi_app_shutdown(self, app: FastAPI):
+        await super().fastapi_app_shutdown(app)
+        if http_client.get():
+            await http_client.get().aclose()
+            http_client.set(None)
+
     def migrate_database(self, args):
         super().migrate_database(args)
 
@@ -20,9 +20,16 @@ class Settings(Settings):
     )
 
     login_providers_table_name: str = "login_providers"
+    # TTL (in seconds) for the in-memory login provider cache.
+    # Set to 0 to disable caching.
+    login_providers_cache_ttl_secs: int = 300
 
     auth_enabled: bool = True
 
+    # Timeout (in seconds) for all outbound calls made through the shared
+    # http client (token, userinfo and JWKS endpoints).
+    http_client_timeout_secs: float = 10
+
     auth_default_issuers: List[str] = []
     auth_default_audiences: List[str] = []
     auth_default_jwks_urls: List[str] = []
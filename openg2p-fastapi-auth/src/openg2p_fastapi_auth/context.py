@@ -1,5 +1,12 @@
 from contextvars import ContextVar
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import httpx
 
 # TODO: Handle JWKs Cache properly
 jwks_cache: ContextVar[Dict[str, Any]] = ContextVar("jwks_cache", default={})
+
+# Shared async HTTP client, to be reused across requests
+http_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "http_client", default=None
+)
@@ -1,9 +1,9 @@
 import logging
 import secrets
+import time
 import urllib.parse
-from typing import Annotated, List, Union
+from typing import Annotated, Dict, List, Optional, Tuple, Union
 
-import httpx
 import orjson
 from fastapi import Depends, HTTPException, Response, status
 from fastapi.responses import RedirectResponse
@@ -12,6 +12,7 @@ from openg2p_fastapi_common.controller import BaseController
 from openg2p_fastapi_common.errors.http_exceptions import InternalServerError
 
 from ..config import Settings
+from ..context import http_client
 from ..dependencies import JwtBearerAuth
 from ..models.credentials import AuthCredentials
 from ..models.login_provider import LoginProviderHttpResponse, LoginProviderResponse
@@ -22,6 +23,9 @@ from ..models.provider_auth_parameters import OauthProviderParameters
 _config = Settings.get_config(strict=False)
 _logger = logging.getLogger(_config.logging_default_logger_name)
 
+# Entropy (in bytes) of the per-request oauth nonce
+_nonce_bytes = 32
+
 
 class AuthController(BaseController):
     def __init__(self, **kwargs):
@@ -29,6 +33,22 @@ class AuthController(BaseController):
         self.router.prefix += "/auth"
         self.router.tags += ["auth"]
 
+        # Login providers rarely change. Cache DB rows in-memory with a TTL
+        # to keep DB round-trips off the auth hot path.
+        self._login_providers_cache: Optional[Tuple[float, List[LoginProvider]]] = None
+        self._login_providers_response_cache: Optional[
+            Tuple[float, LoginProviderHttpResponse]
+        ] = None
+        self._login_provider_id_cache: Dict[int, Tuple[float, LoginProvider]] = {}
+        self._login_provider_iss_cache: Dict[str, Tuple[float, LoginProvider]] = {}
+
+        # Per-provider precomputed oauth data: validated parameters and the
+        # static part of the authorize query params.
+        self._oauth_provider_params_cache: Dict[
+            int, Tuple[float, OauthProviderParameters]
+        ] = {}
+        self._authorize_query_params_cache: Dict[int, Tuple[float, dict]] = {}
+
         self.router.add_api_route(
             "/profile",
             self.get_profile,
@@ -90,8 +110,11 @@ class AuthController(BaseController):
         Get available Login Providers List. Can also be used to display login providers on UI.
         Use getLoginProviderRedirect API to redirect to this Login Provider to perform login.
         """
+        cached = self._login_providers_response_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
         login_providers = await self.get_login_providers_db()
-        return LoginProviderHttpResponse(
+        response = LoginProviderHttpResponse(
             loginProviders=[
                 LoginProviderResponse(
                     id=lp.id,
@@ -103,6 +126,11 @@ class AuthController(BaseController):
                 for lp in login_providers
             ],
         )
+        self._login_providers_response_cache = (
+            time.monotonic() + _config.login_providers_cache_ttl_secs,
+            response,
+        )
+        return response
 
     async def get_login_provider_redirect(self, id: int, redirect_uri: str = "/"):
         """
@@ -127,25 +155,18 @@ class AuthController(BaseController):
             )
 
         if login_provider.type == LoginProviderTypes.oauth2_auth_code:
-            auth_parameters = OauthProviderParameters.model_validate(
-                login_provider.authorization_parameters
+            auth_parameters = self.get_oauth_provider_parameters(login_provider)
+            authorize_query_params = dict(
+                self.get_authorize_query_params_base(login_provider, auth_parameters)
+            )
+            authorize_query_params["nonce"] = secrets.token_urlsafe(_nonce_bytes)
+            # urlencode accepts bytes values, so skip decoding to str
+            authorize_query_params["state"] = orjson.dumps(
+                {
+                    "p": login_provider.id,
+                    "r": redirect_uri,
+                }
             )
-            authorize_query_params = {
-                "client_id": auth_parameters.client_id,
-                "response_type": auth_parameters.response_type,
-                "redirect_uri": auth_parameters.redirect_uri,
-                "scope": auth_parameters.scope,
-                "nonce": secrets.token_urlsafe(),
-                "code_verifier": auth_parameters.code_verifier,
-                "code_challenge": auth_parameters.code_challenge,
-                "code_challenge_method": auth_parameters.code_challenge_method,
-                "state": orjson.dumps(
-                    {
-                        "p": login_provider.id,
-                        "r": redirect_uri,
-                    }
-                ).decode(),
-            }
 
             authorize_query_params.update(auth_parameters.extra_authorize_parameters)
             return RedirectResponse(
@@ -154,14 +175,86 @@ class AuthController(BaseController):
         else:
             raise NotImplementedError()
 
+    def get_oauth_provider_parameters(
+        self, login_provider: LoginProvider
+    ) -> OauthProviderParameters:
+        """
+        Validated OauthProviderParameters of the given login provider,
+        cached per provider so the pydantic validation (including the code
+        challenge computation) is not repeated on every request.
+        """
+        cached = self._oauth_provider_params_cache.get(login_provider.id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        auth_parameters = OauthProviderParameters.model_validate(
+            login_provider.authorization_parameters
+        )
+        self._oauth_provider_params_cache[login_provider.id] = (
+            time.monotonic() + _config.login_providers_cache_ttl_secs,
+            auth_parameters,
+        )
+        return auth_parameters
+
+    def get_authorize_query_params_base(
+        self, login_provider: LoginProvider, auth_parameters: OauthProviderParameters
+    ) -> dict:
+        """
+        Static part of the authorize query params of the given login
+        provider. Only nonce and state vary per request, so the rest is
+        computed once per provider and reused.
+        """
+        cached = self._authorize_query_params_cache.get(login_provider.id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        authorize_query_params = {
+            "client_id": auth_parameters.client_id,
+            "response_type": auth_parameters.response_type,
+            "redirect_uri": auth_parameters.redirect_uri,
+            "scope": auth_parameters.scope,
+            "code_verifier": auth_parameters.code_verifier,
+            "code_challenge": auth_parameters.code_challenge,
+            "code_challenge_method": auth_parameters.code_challenge_method,
+        }
+        self._authorize_query_params_cache[login_provider.id] = (
+            time.monotonic() + _config.login_providers_cache_ttl_secs,
+            authorize_query_params,
+        )
+        return authorize_query_params
+
     async def get_login_providers_db(self) -> List[LoginProvider]:
-        return await LoginProvider.get_all()
+        cached = self._login_providers_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        login_providers = await LoginProvider.get_all()
+        self._login_providers_cache = (
+            time.monotonic() + _config.login_providers_cache_ttl_secs,
+            login_providers,
+        )
+        return login_providers
 
     async def get_login_provider_db_by_id(self, id: int) -> LoginProvider:
-        return await LoginProvider.get_by_id(id)
+        cached = self._login_provider_id_cache.get(id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        login_provider = await LoginProvider.get_by_id(id)
+        if login_provider:
+            self._login_provider_id_cache[id] = (
+                time.monotonic() + _config.login_providers_cache_ttl_secs,
+                login_provider,
+            )
+        return login_provider
 
     async def get_login_provider_db_by_iss(self, iss: str) -> LoginProvider:
-        return await LoginProvider.get_login_provider_from_iss(iss)
+        cached = self._login_provider_iss_cache.get(iss)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        login_provider = await LoginProvider.get_login_provider_from_iss(iss)
+        if login_provider:
+            self._login_provider_iss_cache[iss] = (
+                time.monotonic() + _config.login_providers_cache_ttl_secs,
+                login_provider,
+            )
+        return login_provider
 
     async def get_oauth_validation_data(
         self,
@@ -181,17 +274,15 @@ class AuthController(BaseController):
         if not provider:
             provider = await self.get_login_provider_db_by_iss(iss)
         # TODO: Check if provider is None
-        auth_params = OauthProviderParameters.model_validate(
-            provider.authorization_parameters
-        )
+        auth_params = self.get_oauth_provider_parameters(provider)
         try:
-            response = httpx.get(
+            response = await http_client.get().get(
                 auth_params.validate_endpoint,
                 headers={"Authorization": f"Bearer {access_token}"},
             )
             response.raise_for_status()
             if response.headers["content-type"].startswith("application/json"):
-                res = response.json()
+                res = orjson.loads(response.content)
             elif response.headers["content-type"].startswith("application/jwt"):
                 # jwks_cache.get().get(auth.iss),
                 # TODO: Skipping this jwt validation. Some errors.
@@ -1,7 +1,6 @@
 import logging
 from datetime import datetime, timedelta, timezone
 
-import httpx
 import orjson
 from fastapi import Request
 from fastapi.responses import RedirectResponse
@@ -10,11 +9,9 @@ from openg2p_fastapi_common.controller import BaseController
 from openg2p_fastapi_common.errors.http_exceptions import UnauthorizedError
 
 from ..config import Settings
+from ..context import http_client
 from ..models.orm.login_provider import LoginProviderTypes
-from ..models.provider_auth_parameters import (
-    OauthClientAssertionType,
-    OauthProviderParameters,
-)
+from ..models.provider_auth_parameters import OauthClientAssertionType
 from .auth_controller import AuthController
 
 _config = Settings.get_config(strict=False)
@@ -59,8 +56,8 @@ class OAuthController(BaseController):
         )
 
         if login_provider.type == LoginProviderTypes.oauth2_auth_code:
-            auth_parameters = OauthProviderParameters.model_validate(
-                login_provider.authorization_parameters
+            auth_parameters = self.auth_controller.get_oauth_provider_parameters(
+                login_provider
             )
             token_request_data = {
                 "client_id": auth_parameters.client_id,
@@ -75,17 +72,18 @@ class OAuthController(BaseController):
                 auth_parameters.client_assertion_type
                 == OauthClientAssertionType.private_key_jwt
             ):
+                now = datetime.utcnow()
                 token_request_data.update(
                     {
-                        "client_assertion_type": auth_parameters.client_assertion_type,
+                        "client_assertion_type": auth_parameters.client_assertion_type.value,
                         "client_assertion": jwt.encode(
                             {
                                 "iss": auth_parameters.client_id,
                                 "sub": auth_parameters.client_id,
                                 "aud": auth_parameters.client_assertion_jwt_aud
                                 or auth_parameters.token_endpoint,
-                                "exp": datetime.utcnow() + timedelta(hours=1),
-                                "iat": datetime.utcnow(),
+                                "exp": now + timedelta(hours=1),
+                                "iat": now,
                             },
                             auth_parameters.client_assertion_jwk,
                             algorithm="RS256",
@@ -98,13 +96,13 @@ class OAuthController(BaseController):
             ):
                 token_auth = (auth_parameters.client_id, auth_parameters.client_secret)
             try:
-                res = httpx.post(
+                res = await http_client.get().post(
                     auth_parameters.token_endpoint,
                     auth=token_auth,
-                    data=orjson.loads(orjson.dumps(token_request_data)),
+                    data=token_request_data,
                 )
                 res.raise_for_status()
-                res = res.json()
+                res = orjson.loads(res.content)
             except Exception as e:
                 _logger.exception(
                     "Error while fetching token from token endpoint, %s",
@@ -1,6 +1,7 @@
+import asyncio
+from functools import partial
 from typing import Optional
 
-import httpx
 from fastapi import Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
@@ -11,7 +12,7 @@ from openg2p_fastapi_common.errors.http_exceptions import (
 )
 
 from .config import Settings
-from .context import jwks_cache
+from .context import http_client, jwks_cache
 from .models.credentials import AuthCredentials
 
 _config = Settings.get_config(strict=False)
@@ -85,7 +86,7 @@ class JwtBearerAuth(HTTPBearer):
                     else iss.rstrip("/") + "/.well-known/jwks.json"
                 )
 
-                res = httpx.get(jwks_url)
+                res = await http_client.get().get(jwks_url)
                 res.raise_for_status()
                 jwks = res.json()
                 jwks_cache.get()[iss] = jwks
@@ -95,15 +96,22 @@ class JwtBearerAuth(HTTPBearer):
                     message=f"Something went wrong while trying to fetch Jwks. {repr(e)}",
                 ) from e
 
+        # Signature verification is CPU bound. Offload to the default
+        # executor so the event loop is not blocked per request.
+        loop = asyncio.get_running_loop()
         try:
-            jwt.decode(
-                jwt_token,
-                jwks,
-                options={
-                    "verify_aud": False,
-                    "verify_iss": False,
-                    "verify_sub": False,
-                },
+            await loop.run_in_executor(
+                None,
+                partial(
+                    jwt.decode,
+                    jwt_token,
+                    jwks,
+                    options={
+                        "verify_aud": False,
+                        "verify_iss": False,
+                        "verify_sub": False,
+                    },
+                ),
             )
         except Exception as e:
             raise UnauthorizedError(
@@ -112,19 +120,25 @@ class JwtBearerAuth(HTTPBearer):
 
         if jwt_id_token:
             try:
-                res = jwt.decode(
-                    jwt_id_token,
-                    jwks,
-                    access_token=jwt_token,
-                    options={
-                        "verify_aud": False,
-                        "verify_iss": False,
-                        "verify_sub": False,
-                        "verify_at_hash": api_auth_settings.get(
-                            "id_token_verify_at_hash",
-                            config_dict.get("default_id_token_verify_at_hash", True),
-                        ),
-                    },
+                res = await loop.run_in_executor(
+                    None,
+                    partial(
+                        jwt.decode,
+                        jwt_id_token,
+                        jwks,
+                        access_token=jwt_token,
+                        options={
+                            "verify_aud": False,
+                            "verify_iss": False,
+                            "verify_sub": False,
+                            "verify_at_hash": api_auth_settings.get(
+                                "id_token_verify_at_hash",
+                                config_dict.get(
+                                    "default_id_token_verify_at_hash", True
+                                ),
+                            ),
+                        },
+                    ),
                 )
                 unverified_payload = self.combine_tokens(unverified_payload, res)
             except Exception as e: